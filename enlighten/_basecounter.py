@@ -11,9 +11,8 @@
 Provides BaseCounter and PrintableCounter classes
 """
 
-import time
-
-from enlighten._util import BASESTRING, EnlightenWarning, lru_cache, warn_best_level
+from enlighten._util import (BASESTRING, EnlightenWarning, lru_cache, monotonic, raise_from_none,
+                             warn_best_level)
 
 try:
     from collections.abc import Iterable
@@ -21,6 +20,43 @@ except ImportError:  # pragma: no cover(Python 2)
     from collections import Iterable  # pylint: disable=deprecated-class
 
 
+@lru_cache(maxsize=512)
+def resolve_color(term, value):
+    """
+    Args:
+        term(:py:class:`blessed.Terminal`): Terminal instance
+        value: Color as a string, integer from 0 to 255, or tuple of three integers for RGB
+
+    Returns:
+        :py:class:`blessed.formatters.FormattingString`: Callable to apply color
+
+    Caching function to resolve a color to terminal code
+
+    Colors are cached per terminal rather than per counter, so counters sharing a manager
+    don't resolve the same color again
+    """
+
+    # Color provided as an int form 0 to 255
+    if isinstance(value, int) and 0 <= value <= 255:
+        return term.color(value)
+
+    # Color provided as a string
+    if isinstance(value, BASESTRING):
+        color_cap = term.formatter(value)
+        if not color_cap and term.does_styling and term.number_of_colors:
+            raise AttributeError('Invalid color specified: %s' % value)
+        return color_cap
+
+    # Color provided as an RGB iterable, tuple is checked first to avoid slower ABC check
+    if isinstance(value, (tuple, Iterable)) and \
+            len(value) == 3 and \
+            all(isinstance(_, int) and 0 <= _ <= 255 for _ in value):
+        return term.color_rgb(*value)
+
+    # Invalid format given
+    raise AttributeError('Invalid color specified: %s' % repr(value))
+
+
 class BaseCounter(object):
     """
     Args:
@@ -30,7 +66,7 @@ class BaseCounter(object):
     Base class for counters
     """
 
-    __slots__ = ('_color', '_count', 'manager', 'start_count')
+    __slots__ = ('_color', '_colorize_call', '_color_wrap', '_count', 'manager', 'start_count')
     _repr_attrs = ('count', 'color')
     _placeholder_ = u'___ENLIGHTEN_PLACEHOLDER___'
     _placeholder_len_ = len(_placeholder_)
@@ -51,7 +87,7 @@ class BaseCounter(object):
             kwargs = keywords
 
         self._count = self.start_count = kwargs.pop('count', 0)
-        self._color = None
+        self._color = self._colorize_call = self._color_wrap = None
 
         self.manager = kwargs.pop('manager', None)
         if self.manager is None:
@@ -92,37 +128,21 @@ class BaseCounter(object):
             self._color = None
 
         elif isinstance(value, list):
-            self._color = (value, self._resolve_color(tuple(value)))
+            self._color = (value, resolve_color(self.manager.term, tuple(value)))
 
         else:
-            self._color = (value, self._resolve_color(value))
-
-    @lru_cache(maxsize=512)
-    def _resolve_color(self, value):
-        """
-        Caching method to resolve a color to terminal code
-        """
+            self._color = (value, resolve_color(self.manager.term, value))
 
-        # Color provided as an int form 0 to 255
-        if isinstance(value, int) and 0 <= value <= 255:
-            return self.manager.term.color(value)
+        # Keep the resolved color callable separately since it's used on every format
+        self._colorize_call = None if value is None else self._color[1]
 
-        # Color provided as a string
-        if isinstance(value, BASESTRING):
-            term = self.manager.term
-            color_cap = self.manager.term.formatter(value)
-            if not color_cap and term.does_styling and term.number_of_colors:
-                raise AttributeError('Invalid color specified: %s' % value)
-            return color_cap
-
-        # Color provided as an RGB iterable
-        if isinstance(value, Iterable) and \
-                len(value) == 3 and \
-                all(isinstance(_, int) and 0 <= _ <= 255 for _ in value):
-            return self.manager.term.color_rgb(*value)
-
-        # Invalid format given
-        raise AttributeError('Invalid color specified: %s' % repr(value))
+        # Sequences the callable wraps around content, so they can be concatenated directly
+        if value is None:
+            self._color_wrap = None
+        else:
+            wrapped = self._colorize_call(self._placeholder_)
+            prefix, _, suffix = wrapped.partition(self._placeholder_)
+            self._color_wrap = (prefix, suffix)
 
     def _colorize(self, content):
         """
@@ -137,8 +157,16 @@ class BaseCounter(object):
         If no color is specified for this instance, the content is returned unmodified
         """
 
-        # Used spec cached by color.setter if available
-        return content if self._color is None else self._color[1](content)
+        colorize_call = self._colorize_call
+        if colorize_call is None:
+            return content
+
+        # Content containing the closing sequence needs the color reapplied after it
+        prefix, suffix = self._color_wrap
+        if suffix and suffix in content:
+            return colorize_call(content)
+
+        return prefix + content + suffix
 
     def update(self, *args, **kwargs):
         """
@@ -147,15 +175,34 @@ class BaseCounter(object):
 
         raise NotImplementedError
 
+    @staticmethod
+    def _iter(iterable):
+        """
+        Args:
+            iterable(:py:term:`iterable`): Argument passed when called as a function
+
+        Returns:
+            :py:term:`iterator`: Iterator for ``iterable``
+
+        Raise :py:exc:`TypeError` if ``iterable`` is not iterable
+        """
+
+        try:
+            iterator = iter(iterable)
+        except TypeError:
+            raise_from_none(TypeError('Argument type %s is not iterable'
+                                      % type(iterable).__name__))
+
+        return iterator
+
     def __call__(self, *args):
 
-        for iterable in args:
-            if not isinstance(iterable, Iterable):
-                raise TypeError('Argument type %s is not iterable' % type(iterable).__name__)
+        update = self.update
 
-            for element in iterable:
+        for iterable in args:
+            for element in self._iter(iterable):
                 yield element
-                self.update()
+                update()
 
 
 class PrintableCounter(BaseCounter):  # pylint: disable=too-many-instance-attributes
@@ -179,7 +226,7 @@ class PrintableCounter(BaseCounter):  # pylint: disable=too-many-instance-attrib
         self.leave = kwargs.pop('leave', True)
         self.min_delta = kwargs.pop('min_delta', 0.1)
         self._pinned = False
-        self.last_update = self.start = self._count_updated = time.time()
+        self.last_update = self.start = self._count_updated = monotonic()
 
     def __str__(self):
 
@@ -207,7 +254,7 @@ class PrintableCounter(BaseCounter):  # pylint: disable=too-many-instance-attrib
     def count(self, value):
 
         self._count = value
-        self._count_updated = time.time()
+        self._count_updated = monotonic()
 
     @property
     def elapsed(self):
@@ -215,7 +262,18 @@ class PrintableCounter(BaseCounter):  # pylint: disable=too-many-instance-attrib
         Get elapsed time is seconds (float)
         """
 
-        return (self._closed or time.time()) - self.start
+        return self._get_elapsed(monotonic())
+
+    def _get_elapsed(self, now):
+        """
+        Args:
+            now(float): Current time as returned by :py:func:`monotonic`
+
+        Returns:
+            :py:class:`float`: Elapsed time in seconds relative to ``now``
+        """
+
+        return (self._closed or now) - self.start
 
     @property
     def fill(self):
@@ -267,7 +325,7 @@ class PrintableCounter(BaseCounter):  # pylint: disable=too-many-instance-attrib
         if self._closed:
             warn_best_level('Closing already closed counter: %r' % self, EnlightenWarning)
         else:
-            self._closed = time.time()
+            self._closed = monotonic()
 
         if clear and not self.leave:
             self.clear()
@@ -295,7 +353,12 @@ class PrintableCounter(BaseCounter):  # pylint: disable=too-many-instance-attrib
         """
 
         if self.enabled:
-            self.last_update = time.time()
+            self.last_update = now = monotonic()
+
+            # Use the same time reading rather than getting it again when formatting
+            if elapsed is None:
+                elapsed = self._get_elapsed(now)
+
             self.manager.write(output=self.format, flush=flush, counter=self, elapsed=elapsed)
 
     def _fill_text(self, text, width, offset=None):
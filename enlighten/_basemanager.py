@@ -12,13 +12,13 @@ Provides BaseManager class
 """
 
 import sys
-import time
 from collections import OrderedDict
 
 from blessed import Terminal
 
 from enlighten._counter import Counter
 from enlighten._statusbar import StatusBar
+from enlighten._util import monotonic
 
 
 class BaseManager(object):
@@ -263,7 +263,7 @@ class BaseManager(object):
         pos = 1
         for ctr in reversed(self.counters):
 
-            if ctr in pinned.values():
+            if ctr._pinned:
                 continue
 
             old_pos = self.counters[ctr]
@@ -327,7 +327,7 @@ class BaseManager(object):
         to_refresh = []
         for ctr in reversed(self.counters):
 
-            if ctr in pinned.values():
+            if ctr._pinned:
                 continue
 
             old_pos = self.counters[ctr]
@@ -358,7 +358,7 @@ class BaseManager(object):
         """
 
         self.refresh_lock = True
-        current_time = time.time()
+        current_time = monotonic()
 
         for counter in self.autorefresh:
 
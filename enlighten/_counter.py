@@ -13,16 +13,14 @@ Provides Counter and SubCounter classes
 
 import math
 import os
-import platform
 import re
 import sys
-import time
 
 from prefixed import Float
 
 from enlighten._basecounter import BaseCounter, PrintableCounter
-from enlighten._util import (EnlightenWarning, FORMAT_MAP_SUPPORT, format_time,
-                             raise_from_none, warn_best_level)
+from enlighten._util import (EnlightenWarning, compile_format, format_field_names, format_time,
+                             lru_cache, monotonic, raise_from_none, warn_best_level)
 
 COUNTER_FMT = u'{desc}{desc_pad}{count:d} {unit}{unit_pad}' + \
               u'[{elapsed}, {rate:.2f}{unit_pad}{unit}/s]{fill}'
@@ -33,7 +31,7 @@ BAR_FMT = u'{desc}{desc_pad}{percentage:3.0f}%|{bar}| {count:{len_total}d}/{tota
 STATUS_FMT = u'{message}'
 
 # Even with cp65001, Windows doesn't seem to support all unicode characters. Windows Terminal does
-if platform.system() == 'Windows' and not os.environ.get('WT_SESSION', None):  # pragma: no cover
+if sys.platform == 'win32' and not os.environ.get('WT_SESSION', None):  # pragma: no cover
     SERIES_STD = u' ▌█'
 else:
     SERIES_STD = u' ▏▎▍▌▋▊▉█'
@@ -54,6 +52,41 @@ RESERVED_FIELDS = {'count', 'desc', 'desc_pad', 'elapsed', 'interval', 'rate', '
 RE_SUBCOUNTER_FIELDS = re.compile(r'(count|percentage|eta|interval|rate)_(\d+)')
 
 
+@lru_cache(maxsize=128)
+def subcounter_field_names(num):
+    """
+    Args:
+        num(int): Subcounter number, starting at 1
+
+    Returns:
+        :py:class:`tuple`: Field names for count, percentage, rate, interval, and eta
+
+    Field names are cached so they aren't rebuilt for each subcounter on every format
+    """
+
+    return tuple('%s_%d' % (field, num)
+                 for field in ('count', 'percentage', 'rate', 'interval', 'eta'))
+
+
+@lru_cache(maxsize=128)
+def reserved_field_names(names):
+    """
+    Args:
+        names(frozenset): User-defined field names
+
+    Returns:
+        :py:class:`frozenset`: Names which conflict with reserved fields
+
+    Results are cached since user-defined field names rarely change between formats
+    """
+
+    return names & RESERVED_FIELDS | frozenset(
+        match.group()
+        for match in (RE_SUBCOUNTER_FIELDS.match(key) for key in names)
+        if match
+    )
+
+
 class SubCounter(BaseCounter):
     """
     A child counter for multicolored progress bars.
@@ -91,6 +124,22 @@ class SubCounter(BaseCounter):
 
         self.parent = parent
         self.all_fields = all_fields
+        parent._subcount += count  # pylint: disable=protected-access
+
+    @property
+    def count(self):
+        """
+        Running count
+        """
+
+        return self._count
+
+    @count.setter
+    def count(self, value):
+
+        # Keep the parent's running total of subcounter counts current
+        self.parent._subcount += value - self._count  # pylint: disable=protected-access
+        self._count = value
 
     def update(self, incr=1, force=False):  # pylint: disable=arguments-differ
         """
@@ -105,7 +154,9 @@ class SubCounter(BaseCounter):
         Progress bar is only redrawn if min_delta seconds past since the last update on the parent.
         """
 
-        self.count += incr
+        # Adjust counts directly rather than going through the count property
+        self._count += incr
+        self.parent._subcount += incr  # pylint: disable=protected-access
         self.parent.update(incr, force)
 
     def update_from(self, source, incr=1, force=False):
@@ -433,8 +484,9 @@ class Counter(PrintableCounter):
     """
     # pylint: disable=too-many-instance-attributes
 
-    __slots__ = ('all_fields', 'bar_format', 'counter_format', 'desc', 'fields',
-                 'offset', 'series', 'total', 'unit', '_fields', '_subcounters')
+    __slots__ = ('all_fields', 'bar_format', 'counter_format', 'desc', 'fields', 'offset',
+                 'total', 'unit', '_bar_cache', '_fields', '_series', '_subcount',
+                 '_subcounters')
     _repr_attrs = ('desc', 'total', 'count', 'unit', 'color')
 
     # pylint: disable=too-many-arguments
@@ -450,23 +502,44 @@ class Counter(PrintableCounter):
         self.counter_format = kwargs.pop('counter_format', COUNTER_FMT)
         self.desc = kwargs.pop('desc', None)
         self.offset = kwargs.pop('offset', None)
+        self._bar_cache = None
         self.series = kwargs.pop('series', SERIES_STD)
         self.total = kwargs.pop('total', None)
         self.unit = kwargs.pop('unit', None)
         self._fields = kwargs
+        self._subcount = 0
         self._subcounters = []
 
-    @property
-    def elapsed(self):
+    def _get_elapsed(self, now):
         """
-        Get elapsed time is seconds (float)
+        Args:
+            now(float): Current time as returned by :py:func:`monotonic`
+
+        Returns:
+            :py:class:`float`: Elapsed time in seconds relative to ``now``
         """
 
         # If closed or total is reached, use last time count was updated
         if self._closed or self._count == self.total:
             return self._count_updated - self.start
 
-        return time.time() - self.start
+        return now - self.start
+
+    @property
+    def series(self):
+        """
+        Progression series used to draw the bar
+        """
+
+        return self._series
+
+    @series.setter
+    def series(self, value):
+
+        self._series = value
+
+        # Cached bar text was drawn with the previous series
+        self._bar_cache = (None, None)
 
     @property
     def subcount(self):
@@ -474,8 +547,7 @@ class Counter(PrintableCounter):
         Sum of counts from all subcounters
         """
 
-        # pylint: disable=protected-access
-        return sum(subcounter._count for subcounter in self._subcounters)
+        return self._subcount
 
     # pylint: disable=too-many-locals
     def _get_subcounters(self, elapsed, fields, bar_fields=True, force_float=False):
@@ -497,21 +569,25 @@ class Counter(PrintableCounter):
         subcounters = []
         count_00 = 0
         start_count_00 = 0
+        percentage_00 = 0.0
 
-        if not self._subcounters:
-            return subcounters
+        # Values shared by all subcounters
+        total = self.total
+        total_float = float(total) if total and bar_fields else None
 
         for num, subcounter in enumerate(self._subcounters, 1):
 
             count = subcounter.count
             count_00 += count
             start_count_00 += subcounter.start_count
+            count_key, percentage_key, rate_key, interval_key, eta_key = subcounter_field_names(num)
 
-            fields['count_%d' % num] = Float(count) if force_float else count
+            fields[count_key] = Float(count) if force_float else count
 
-            subPercentage = count / float(self.total) if self.total and bar_fields else 0.0
+            subPercentage = count / total_float if total_float else 0.0
+            percentage_00 += subPercentage
             if bar_fields:
-                fields['percentage_%d' % num] = subPercentage * 100
+                fields[percentage_key] = subPercentage * 100
 
             # Save in tuple: count, percentage
             subcounters.append((subcounter, subPercentage))
@@ -522,22 +598,22 @@ class Counter(PrintableCounter):
             # Explicit conversion to float required for Python 2
             interations = float(abs(count - subcounter.start_count))
             rate = Float(interations / elapsed) if elapsed else Float(0.0)
-            fields['rate_%d' % num] = rate
-            fields['interval_%d' % num] = rate ** -1 if rate else rate
+            fields[rate_key] = rate
+            fields[interval_key] = rate ** -1 if rate else rate
 
             if not bar_fields:
                 continue
 
-            if self.total == 0:
-                fields['eta_%d' % num] = u'00:00'
+            if total == 0:
+                fields[eta_key] = u'00:00'
             elif rate:
-                fields['eta_%d' % num] = format_time((self.total - interations) / rate)
+                fields[eta_key] = format_time((total - interations) / rate)
             else:
-                fields['eta_%d' % num] = u'?'
+                fields[eta_key] = u'?'
 
         # Percentage_0 and percentage_00, bar_format only
         if bar_fields:
-            fields['percentage_00'] = percentage_00 = sum(sub[1] for sub in subcounters) * 100
+            fields['percentage_00'] = percentage_00 = percentage_00 * 100
             fields['percentage_0'] = fields['percentage'] - percentage_00
 
         # count_00 fields (Sum of subcounters)
@@ -575,19 +651,17 @@ class Counter(PrintableCounter):
         iterations = float(abs(count - self.start_count))
 
         fields = self.fields.copy()
-        fields.update(self._fields)
+        if self._fields:
+            fields.update(self._fields)
 
         # Warn on reserved fields
-        reserved_fields = set(fields) & RESERVED_FIELDS | {
-            match.group()
-            for match in (RE_SUBCOUNTER_FIELDS.match(key) for key in fields)
-            if match
-        }
+        if fields:
+            reserved_fields = reserved_field_names(frozenset(fields))
 
-        if reserved_fields:
-            warn_best_level('Ignoring reserved fields specified as user-defined fields: %s' %
-                            ', '.join(reserved_fields),
-                            EnlightenWarning)
+            if reserved_fields:
+                warn_best_level('Ignoring reserved fields specified as user-defined fields: %s' %
+                                ', '.join(reserved_fields),
+                                EnlightenWarning)
 
         force_float = isinstance(count, float) or isinstance(total, float)
         fields['count'] = Float(count) if force_float else count
@@ -603,13 +677,19 @@ class Counter(PrintableCounter):
 
         fields['elapsed'] = format_time(elapsed)
 
+        # Only process bar if total was given and n doesn't exceed total
+        is_bar = total is not None and count <= total
+
         # Get rate. Elapsed could be 0 if counter was not updated and has a zero total.
         rate = Float(iterations / elapsed) if elapsed else Float(0.0)
         fields['rate'] = rate
-        fields['interval'] = rate ** -1 if rate else rate
 
-        # Only process bar if total was given and n doesn't exceed total
-        if total is not None and count <= total:
+        # Interval is relatively expensive, so skip it when the format doesn't use it
+        field_names = format_field_names(self.bar_format if is_bar else self.counter_format)
+        if field_names is None or 'interval' in field_names:
+            fields['interval'] = rate ** -1 if rate else rate
+
+        if is_bar:
             return self._format_bar(fields, iterations, width, elapsed, force_float)
 
         # Otherwise return a counter
@@ -682,32 +762,33 @@ class Counter(PrintableCounter):
         Format progress bar
         """
 
+        total = self.total
         fields['bar'] = self._placeholder_
-        fields['len_total'] = len(str(self.total))
+        fields['len_total'] = len(str(total))
 
         # Get percentage
-        if self.total == 0:
+        if total == 0:
             # If total is 0, force to 100 percent
             percentage = 1
             fields['eta'] = u'00:00'
         else:
             # Use float to force to float in Python 2
-            percentage = self._count / float(self.total)
+            percentage = self._count / float(total)
             rate = fields['rate']
 
             # Get eta. Use iterations so a counter running backwards is accurate
-            fields['eta'] = format_time((self.total - iterations) / rate) if rate else u'?'
+            fields['eta'] = format_time((total - iterations) / rate) if rate else u'?'
         fields['percentage'] = percentage * 100
 
         # Have to go through subcounters here so the fields are available
-        subcounters = self._get_subcounters(elapsed, fields, force_float=force_float)
+        if self._subcounters:
+            subcounters = self._get_subcounters(elapsed, fields, force_float=force_float)
+        else:
+            subcounters = None
 
         # Partially format
         try:
-            if FORMAT_MAP_SUPPORT:
-                rtn = self.bar_format.format_map(fields)
-            else:  # pragma: no cover
-                rtn = self.bar_format.format(**fields)
+            rtn = compile_format(self.bar_format)(fields)
         except KeyError as e:
             raise_from_none(ValueError(self._get_format_error(e.args[0])))
 
@@ -718,9 +799,10 @@ class Counter(PrintableCounter):
             # Offset was explicitly given
             barWidth = width - len(rtn) + self.offset + self._placeholder_len_
 
+        # Bar width can be negative if the rest of the format exceeds the width
+        barWidth = max(0, barWidth)
         complete = barWidth * percentage
-        barLen = int(complete)
-        barText = u''
+        barLen = max(0, int(complete))
 
         if subcounters:
             remainder, count = math.modf(barWidth * fields['percentage_0'] / 100)
@@ -740,29 +822,54 @@ class Counter(PrintableCounter):
                     _, idx = remaining.pop()
                     block_count[idx] += 1
 
-            # Format partial bars
-            for idx, subLen in reversed(list(enumerate(block_count))):
-                if idx:
-                    subcounter = subcounters[idx - 1][0]
-                    # pylint: disable=protected-access
-                    barText += subcounter._colorize(self.series[-1] * subLen)
-                else:
-                    # Get main partial bar
-                    barText += self.series[-1] * subLen
+            # Subcounter colors are part of the bar text and can change
+            # pylint: disable=protected-access
+            cache_key = (barWidth, tuple(block_count),
+                         tuple(entry[0]._color for entry in subcounters))
+
+        else:
+            # Index of partial block, -1 when there is none
+            if barLen < barWidth and self.count:
+                partial = int(round((complete - barLen) * (len(self.series) - 1)))
+            else:
+                partial = -1
+
+            cache_key = (barWidth, barLen, partial)
 
-            partial_len = sum(block_count)
+        # Bar text only changes when the number of blocks changes
+        if cache_key == self._bar_cache[0]:
+            barText = self._bar_cache[1]
 
         else:
-            # Get main partial bar
-            barText += self.series[-1] * barLen
-            partial_len = barLen
+            full_char = self.series[-1]
+
+            if subcounters:
+
+                # Format partial bars, last subcounter first, and join once
+                # pylint: disable=protected-access
+                segments = [subcounters[idx - 1][0]._colorize(full_char * block_count[idx])
+                            for idx in range(len(subcounters), 0, -1)]
+
+                # Get main partial bar
+                segments.append(full_char * block_count[0])
+                barText = u''.join(segments)
+                partial_len = sum(block_count)
+
+            else:
+                # Get main partial bar
+                barText = full_char * barLen
+                partial_len = barLen
+
+                # Add partial block
+                if partial >= 0:
+                    barText += self.series[partial]
+                    partial_len += 1
+
+            # If bar isn't complete, add fill
+            if barLen < barWidth:
+                barText += self.series[0] * (barWidth - partial_len)
 
-        # If bar isn't complete, add partial block and fill
-        if barLen < barWidth:
-            if self.count and not subcounters:
-                barText += self.series[int(round((complete - barLen) * (len(self.series) - 1)))]
-                partial_len += 1
-            barText += self.series[0] * (barWidth - partial_len)
+            self._bar_cache = (cache_key, barText)
 
         return rtn.replace(self._placeholder_, self._colorize(barText))
 
@@ -782,13 +889,11 @@ class Counter(PrintableCounter):
         fields['fill'] = self._placeholder_
 
         # Update fields from subcounters
-        self._get_subcounters(elapsed, fields, bar_fields=False, force_float=force_float)
+        if self._subcounters:
+            self._get_subcounters(elapsed, fields, bar_fields=False, force_float=force_float)
 
         try:
-            if FORMAT_MAP_SUPPORT:
-                rtn = self.counter_format.format_map(fields)
-            else:  # pragma: no cover
-                rtn = self.counter_format.format(**fields)
+            rtn = compile_format(self.counter_format)(fields)
         except KeyError as e:
             raise_from_none(ValueError(self._get_format_error(e.args[0], bar_fields=False)))
 
@@ -806,15 +911,46 @@ class Counter(PrintableCounter):
         Progress bar is only redrawn if ``min_delta`` seconds past since the last update
         """
 
-        self.count += incr
-        self._fields.update(fields)
+        # Set count directly so the clock is only read once for the count and the refresh check
+        currentTime = monotonic()
+        self._count += incr
+        self._count_updated = currentTime
+        if fields:
+            self._fields.update(fields)
+
         if self.enabled:
-            currentTime = time.time()
             # Update if force, 100%, or minimum delta has been reached
             if force or self._count == self.total or \
                     currentTime - self.last_update >= self.min_delta:
                 self.refresh(elapsed=currentTime - self.start)
 
+    def __call__(self, *args):
+
+        # Every element is counted, but update() is only called every few elements.
+        # The number of elements between calls adapts so calls happen a few times per min_delta
+        interval = remaining = 1
+        last_check = monotonic()
+
+        for iterable in args:
+            for element in self._iter(iterable):
+                yield element
+                self._count += 1
+                remaining -= 1
+
+                if not remaining:
+                    self.update(0)
+                    since_check = self._count_updated - last_check
+                    last_check = self._count_updated
+
+                    if since_check < self.min_delta / 8.0:
+                        interval = min(interval * 2, 64)
+                    elif since_check > self.min_delta / 2.0:
+                        interval = max(interval // 2, 1)
+                    remaining = interval
+
+            # Account for any elements counted since the last update
+            self.update(0)
+
     def add_subcounter(self, color, count=0, all_fields=None):
         """
     Args:
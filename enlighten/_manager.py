@@ -20,11 +20,30 @@ import threading
 from blessed import Terminal
 
 from enlighten._basemanager import BaseManager
+from enlighten._util import lru_cache
 
 
 RESIZE_SUPPORTED = hasattr(signal, 'SIGWINCH')
 
 
+@lru_cache(maxsize=512)
+def move_to_row(term, row):
+    """
+    Args:
+        term(:py:class:`blessed.Terminal`): Terminal instance
+        row(int): Row to move to
+
+    Returns:
+        :py:class:`str`: Terminal sequence to move the cursor to the start of the row
+
+    Caching function for cursor movement, which is needed on every write
+
+    Sequences are cached per terminal since building them requires a terminfo lookup
+    """
+
+    return term.move(row, 0)
+
+
 class Manager(BaseManager):
     """
 
@@ -100,6 +119,10 @@ class Manager(BaseManager):
         Called when a window resize signal is detected
         """
 
+        # Counters were already reset by an earlier signal that hasn't been handled yet
+        if self.threaded and self._resize:
+            return
+
         # Set semaphore to trigger resize on next write
         self._resize = True
 
@@ -203,9 +226,9 @@ class Manager(BaseManager):
                 buffer.append(term.csr(0, scrollPosition))
 
             # Always reset position
-            buffer.append(term.move(scrollPosition, 0))
+            buffer.append(move_to_row(term, scrollPosition))
             if self.companion_term is not None:
-                self._companion_buffer.append(term.move(scrollPosition, 0))
+                self._companion_buffer.append(move_to_row(term, scrollPosition))
 
     def _flush_streams(self):
         """
@@ -261,7 +284,7 @@ class Manager(BaseManager):
         buffer = self._buffer
         term = self.term
         height = term.height
-        positions = self.counters.values()
+        positions = set(self.counters.values())
 
         if not self.no_resize and RESIZE_SUPPORTED:
             signal.signal(signal.SIGWINCH, self.sigwinch_orig)
@@ -320,7 +343,7 @@ class Manager(BaseManager):
             output = output(**kwargs)
 
         try:
-            self._buffer.extend((term.move(self.height - position, 0),
+            self._buffer.extend((move_to_row(term, self.height - position),
                                  u'\r',
                                  term.clear_eol,
                                  output))
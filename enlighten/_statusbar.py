@@ -11,11 +11,9 @@
 Provides StatusBar class
 """
 
-import time
-
 from enlighten._basecounter import PrintableCounter
-from enlighten._util import (EnlightenWarning, FORMAT_MAP_SUPPORT, format_time,
-                             Justify, raise_from_none, warn_best_level)
+from enlighten._util import (EnlightenWarning, compile_format, format_time,
+                             Justify, monotonic, raise_from_none, warn_best_level)
 
 
 STATUS_FIELDS = {'elapsed', 'fill'}
@@ -144,7 +142,7 @@ class StatusBar(PrintableCounter):
         self.justify = kwargs.pop('justify', Justify.LEFT)
         self.status_format = kwargs.pop('status_format', None)
         self._fields = kwargs
-        self._static = ' '.join(str(arg) for arg in args) if args else None
+        self._static = ' '.join(map(str, args)) if args else None
 
     @property
     def justify(self):
@@ -176,7 +174,7 @@ class StatusBar(PrintableCounter):
         """
 
         width = width or self.manager.width
-        justify = self.justify
+        justify = self._justify
 
         # If static message was given, just return it
         if self._static is not None:
@@ -189,10 +187,11 @@ class StatusBar(PrintableCounter):
         # Generate from format
         else:
             fields = self.fields.copy()
-            fields.update(self._fields)
+            if self._fields:
+                fields.update(self._fields)
 
-            # Warn on reserved fields
-            reserved_fields = set(fields) & STATUS_FIELDS
+            # Warn on reserved fields, only checking the few reserved names against user fields
+            reserved_fields = [field for field in STATUS_FIELDS if field in fields]
             if reserved_fields:
                 warn_best_level('Ignoring reserved fields specified as user-defined fields: %s' %
                                 ', '.join(reserved_fields),
@@ -204,10 +203,7 @@ class StatusBar(PrintableCounter):
 
             # Format
             try:
-                if FORMAT_MAP_SUPPORT:
-                    rtn = self.status_format.format_map(fields)
-                else:  # pragma: no cover
-                    rtn = self.status_format.format(**fields)
+                rtn = compile_format(self.status_format)(fields)
             except KeyError as e:
                 raise_from_none(ValueError('%r specified in format, but not provided' % e.args[0]))
 
@@ -229,10 +225,10 @@ class StatusBar(PrintableCounter):
 
         force = fields.pop('force', False)
 
-        self._static = ' '.join(str(obj) for obj in objects) if objects else None
+        self._static = ' '.join(map(str, objects)) if objects else None
         self._fields.update(fields)
 
         if self.enabled:
-            currentTime = time.time()
+            currentTime = monotonic()
             if force or currentTime - self.last_update >= self.min_delta:
                 self.refresh(elapsed=currentTime - self.start)
@@ -16,6 +16,7 @@ from collections import OrderedDict
 import inspect
 import os
 import re
+from string import Formatter
 import sys
 import warnings
 
@@ -29,6 +30,12 @@ except ImportError:  # pragma: no cover(Python 2)
     # lru_cache was added in Python 3.2
     from backports.functools_lru_cache import lru_cache
 
+try:
+    from time import monotonic  # pylint: disable=unused-import
+except ImportError:  # pragma: no cover(Python 2)
+    # monotonic was added in Python 3.3
+    from time import time as monotonic  # noqa: F401  # pylint: disable=unused-import
+
 
 try:
     BASESTRING = basestring
@@ -43,6 +50,8 @@ RE_COLOR_256 = re.compile(r'\x1b\[38;5;(\d+)m')
 RE_ON_COLOR_256 = re.compile(r'\x1b\[48;5;(\d+)m')
 RE_SET_A = re.compile(r'\x1b\[(\d+)m')
 RE_LINK = re.compile(r'\x1b]8;.*;(.*)\x1b\\')
+RE_FIELD_NAME = re.compile(r'[A-Za-z_]\w*$')
+RE_FIELD_ROOT = re.compile(r'[^.[]*')
 
 CGA_COLORS = ('black', 'red', 'green', 'yellow', 'blue', 'magenta', 'cyan', 'white')
 HTML_ESCAPE = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '?': '&#63;'}
@@ -85,21 +94,141 @@ def format_time(seconds):
         - 1d 0h 01:56
     """
 
+    # Refreshes within the same second produce the same string, so cache on whole seconds
+    return _format_seconds(int(round(seconds)))
+
+
+@lru_cache(maxsize=1024)
+def _format_seconds(seconds):
+    """
+    Args:
+        seconds (int): A period of time expressed in whole seconds
+
+    Returns:
+        :py:class:`str`: Time formatted in seconds, minutes, hours, and days
+    """
+
     # Always do minutes and seconds in mm:ss format
-    minutes, seconds = divmod(round(seconds), 60)
+    minutes, seconds = divmod(seconds, 60)
     hours, minutes = divmod(minutes, 60)
-    rtn = u'%02d:%02d' % (minutes, seconds)
+    if not hours:
+        return u'%02d:%02d' % (minutes, seconds)
 
     #  Add hours if there are any
-    if hours:
-        days, hours = divmod(hours, 24)
-        rtn = u'%dh %s' % (hours, rtn)
+    days, hours = divmod(hours, 24)
+    if not days:
+        return u'%dh %02d:%02d' % (hours, minutes, seconds)
+
+    #  Add days if there are any
+    return u'%dd %dh %02d:%02d' % (days, hours, minutes, seconds)
+
+
+def _format_expression(fmt):
+    """
+    Args:
+        fmt (str): Format string
+
+    Returns:
+        :py:class:`str`: Python expression equivalent to ``fmt.format_map(fields)``
+
+    Raises:
+        ValueError: Format string is invalid or uses features that aren't supported
+
+    Only keyword fields with optional conversions and format specs are supported.
+    Nested fields in format specs are compiled recursively.
+    """
+
+    parts = []
+    for literal, field, spec, conversion in Formatter().parse(fmt):
+        if literal:
+            parts.append(repr(literal))
+
+        if field is None:
+            continue
+
+        # Positional fields, attributes, and indexes are left to format_map()
+        if not RE_FIELD_NAME.match(field):
+            raise ValueError('Unsupported field: %r' % field)
+
+        value = 'fields[%r]' % field
+        if conversion == 'r':
+            value = 'repr(%s)' % value
+        elif conversion == 's':
+            value = 'str(%s)' % value
+        elif conversion is not None:
+            raise ValueError('Unsupported conversion: %r' % conversion)
+
+        spec = _format_expression(spec) if '{' in spec else repr(spec)
+        parts.append('format(%s, %s)' % (value, spec))
 
-        #  Add days if there are any
-        if days:
-            rtn = u'%dd %s' % (days, rtn)
+    return "u''.join((%s,))" % ', '.join(parts) if parts else "u''"
+
+
+@lru_cache(maxsize=128)
+def compile_format(fmt):
+    """
+    Args:
+        fmt (str): Format string
+
+    Returns:
+        :py:term:`function`: Function that accepts a dictionary of fields and returns formatted text
+
+    Compile a format string into a function equivalent to ``fmt.format_map``
+
+    The format string is parsed once rather than on every call. Format strings that
+    can't be compiled fall back to :py:meth:`str.format_map`, so errors are raised
+    when the returned function is called, just as they would be for ``fmt.format_map(fields)``.
+    """
+
+    try:
+        expression = _format_expression(fmt)
+    except ValueError:
+        if FORMAT_MAP_SUPPORT:
+            return fmt.format_map
+        return lambda fields: fmt.format(**fields)  # pragma: no cover(Python 2)
+
+    # format() is bound as a default argument so it's a local lookup
+    namespace = {}
+    source = 'def format_fields(fields, format=format):\n    return %s' % expression
+    exec(source, namespace)  # pylint: disable=exec-used
+    return namespace['format_fields']
+
+
+@lru_cache(maxsize=128)
+def format_field_names(fmt):
+    """
+    Args:
+        fmt (str): Format string
+
+    Returns:
+        :py:class:`frozenset`: Names of fields referenced in the format string
+
+    Only the base name is included for fields with an attribute or index, and fields
+    in nested format specifications are included. If the format string can't be parsed,
+    :py:data:`None` is returned, so errors are raised when it's formatted.
+    """
+
+    try:
+        return frozenset(_iter_field_names(fmt))
+    except ValueError:
+        return None
+
+
+def _iter_field_names(fmt):
+    """
+    Args:
+        fmt (str): Format string
+
+    Returns:
+        :py:term:`generator`: Base names of fields in format string and nested specifications
+    """
 
-    return rtn
+    for _, field, spec, _ in Formatter().parse(fmt):
+        if field is not None:
+            yield RE_FIELD_ROOT.match(field).group()
+        if spec:
+            for name in _iter_field_names(spec):  # pylint: disable=use-yield-from
+                yield name
 
 
 def raise_from_none(exc):  # pragma: no cover
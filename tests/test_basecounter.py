@@ -82,6 +82,10 @@ class TestBaseCounter(TestCase):
         self.assertNotEqual(counter._colorize('test'), 'test')
         self.assertEqual(counter._colorize('test'), self.manager.term.red('test'))
 
+        # Color is reapplied after nested formatting
+        content = 'test' + self.manager.term.blue('nested') + 'test'
+        self.assertEqual(counter._colorize(content), self.manager.term.red(content))
+
     def test_colorize_string_compound(self):
         """Return string formatted with compound color (string)"""
         counter = BaseCounter(manager=self.manager, color='bold_red_on_blue')
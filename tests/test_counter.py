@@ -9,10 +9,12 @@
 Test module for enlighten._counter and enlighten.counter
 """
 
+from itertools import count
+
 from enlighten import Counter as CounterDirect, EnlightenWarning, Manager
 from enlighten._counter import Counter, RESERVED_FIELDS, SERIES_STD as _SERIES_STD
 
-from tests import TestCase, MockManager, MockTTY, MockCounter, PY2, unittest
+from tests import TestCase, mock, MockManager, MockTTY, MockCounter, PY2, unittest
 
 
 # pylint: disable=protected-access
@@ -124,6 +126,37 @@ class TestCounter(TestCase):
         counter.update(98)
         self.assertEqual(counter.output, [1, 100])
 
+    def test_call(self):
+        """
+        When called, every element is counted, but update() is only called periodically
+        """
+
+        counter = MockCounter(total=2000, min_delta=500, manager=self.manager)
+        with mock.patch.object(MockCounter, 'update', autospec=True,
+                               side_effect=Counter.update) as update:
+            self.assertEqual(list(counter(range(1000), range(1000))), list(range(1000)) * 2)
+
+        self.assertEqual(counter.count, 2000)
+        self.assertLess(update.call_count, 50)
+        update.assert_called_with(counter, 0)
+        self.assertEqual(counter.output, [2000])
+
+        # When updates are slow relative to min_delta, update() is called for every element
+        counter = MockCounter(total=10, min_delta=-1, manager=self.manager)
+        self.assertEqual(list(counter(range(5))), list(range(5)))
+        self.assertEqual(counter.output, [1, 2, 3, 4, 5, 5])
+
+        # Interval stays the same when checks are a moderate fraction of min_delta apart
+        counter = MockCounter(total=10, min_delta=1, manager=self.manager)
+        with mock.patch('enlighten._counter.monotonic', side_effect=count(0, 0.25)):
+            with mock.patch.object(MockCounter, 'update', autospec=True,
+                                   side_effect=Counter.update) as update:
+                self.assertEqual(list(counter(range(5))), list(range(5)))
+        self.assertEqual(update.call_count, 6)
+
+        with self.assertRaisesRegex(TypeError, 'Argument type int is not iterable'):
+            list(counter(1))
+
     def test_position(self):
         """
         Position is returned from manager
@@ -172,6 +205,22 @@ class TestCounter(TestCase):
         self.ctr.refresh()
         self.assertEqual(len(self.manager.output), 0)
 
+    def test_refresh_elapsed(self):
+        """
+        When elapsed isn't given, it's determined from the time used for last_update
+        """
+
+        ctr = self.ctr
+        ctr.start -= 5.0
+
+        with mock.patch.object(self.manager, 'write') as write:
+            ctr.refresh()
+        self.assertEqual(write.call_args[1]['elapsed'], ctr.last_update - ctr.start)
+
+        with mock.patch.object(self.manager, 'write') as write:
+            ctr.refresh(elapsed=2.0)
+        self.assertEqual(write.call_args[1]['elapsed'], 2.0)
+
     def test_clear(self):
         """
         Clear counter if enabled
@@ -501,6 +550,40 @@ class TestCounterFormat(TestCase):
         self.assertRegex(formatted, r'Test  50%\|' + u'⬤+⭘+' +
                          r'\|  50/100 \[00:5\d<00:5\d, \d.\d\d ticks/s\]')
 
+    def test_series_changed(self):
+        """
+        Changing series after formatting should not reuse cached characters
+        """
+
+        ctr = Counter(stream=self.tty.stdout, total=100, bar_format=u'{bar}',
+                      series=[' ', '>', '-'], manager=self.manager)
+        ctr.count = 50
+        self.assertEqual(ctr.format(width=10), u'-----     ')
+
+        ctr.series = [u'.', u'#']
+        self.assertEqual(ctr.format(width=10), u'#####.....')
+        self.assertEqual(ctr.format(width=20), u'##########..........')
+
+    def test_negative_total(self):
+        """
+        Negative total and count should still produce a bar
+        """
+
+        ctr = self.manager.counter(total=-10, count=-20, bar_format=u'{bar}')
+        self.assertEqual(ctr.format(width=40), BLOCK * 80)
+
+    def test_subcount_exceeds_count(self):
+        """
+        Negative remaining blocks are treated as empty when subcounts exceed the count
+        """
+
+        ctr = self.manager.counter(total=100, count=50, bar_format=u'{bar}')
+        ctr.add_subcounter('green', count=40)
+        ctr.update(-20)
+
+        formatted = ctr.format(width=40)
+        self.assertEqual(self.manager.term.strip_seqs(formatted), BLOCK * 16 + u' ' * 28)
+
     def test_floats(self):
         """
         Using floats for total and count is supported by the logic, but not by the
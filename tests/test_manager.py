@@ -807,6 +807,12 @@ class TestManager(TestCase):
         self.assertTrue(manager._resize)
         self.assertEqual(counter3.last_update, 0)
 
+        # Additional signals before the next write don't reset counters again
+        counter3.last_update = counter3.start
+        manager._stage_resize()
+        self.assertTrue(manager._resize)
+        self.assertEqual(counter3.last_update, counter3.start)
+
         with mock.patch('%s.width' % TERMINAL, new_callable=mock.PropertyMock) as mockwidth:
             mockwidth.return_value = 70
 
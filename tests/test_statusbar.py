@@ -52,6 +52,11 @@ class TestStatusBar(TestCase):
         sbar = self.manager.status_bar('Hello', 'World!', justify=Justify.CENTER)
         self.assertEqual(sbar.format(), ' ' * 34 + 'Hello World!' + ' ' * 34)
 
+        # Changing justify after creation
+        sbar.justify = Justify.RIGHT
+        self.assertEqual(sbar.justify, self.manager.term.rjust)
+        self.assertEqual(sbar.format(), ' ' * 68 + 'Hello World!')
+
     def test_formatted(self):
         """
         Basic formatted status bar
@@ -130,6 +135,42 @@ class TestStatusBar(TestCase):
         sbar.update()
         self.assertEqual(sbar.called, 3)
 
+    def test_update_after_clear(self):
+        """
+        Static text is redrawn by update() after the status bar is cleared
+        """
+
+        sbar = self.manager.status_bar()
+        drawn = 'write(output=%s, flush=True, position=1)' % ('Hello' + ' ' * 75)
+
+        sbar.last_update = 0
+        sbar.update('Hello')
+        self.assertEqual(self.manager.output[-1], drawn)
+
+        sbar.clear()
+        self.assertEqual(self.manager.output[-1], 'write(output=, flush=True, position=1)')
+
+        sbar.update('Hello')
+        self.assertEqual(self.manager.output[-1], drawn)
+
+    def test_update_after_justify(self):
+        """
+        Static text is redrawn by update() after justification is changed
+        """
+
+        sbar = self.manager.status_bar()
+
+        sbar.last_update = 0
+        sbar.update('Hello')
+        self.assertEqual(self.manager.output[-1],
+                         'write(output=%s, flush=True, position=1)' % ('Hello' + ' ' * 75))
+
+        sbar.justify = Justify.RIGHT
+        sbar.last_update = 0
+        sbar.update('Hello')
+        self.assertEqual(self.manager.output[-1],
+                         'write(output=%s, flush=True, position=1)' % (' ' * 75 + 'Hello'))
+
     def test_fill(self):
         """
         Fill uses remaining space
@@ -132,6 +132,7 @@ class TestSubCounter(TestCase):
             update.assert_called_with(0, False)
             self.assertEqual(self.parent.count, 4)
             self.assertEqual(counter.count, 3)
+            self.assertEqual(self.parent.subcount, 3)
 
     def test_update_from_peer(self):
         """
@@ -154,6 +155,7 @@ class TestSubCounter(TestCase):
             self.assertEqual(self.parent.count, 6)
             self.assertEqual(counter.count, 4)
             self.assertEqual(peer.count, 0)
+            self.assertEqual(self.parent.subcount, 4)
 
 
 class TestCounterSubCounter(TestCase):
@@ -358,6 +360,23 @@ class TestCounterSubCounter(TestCase):
         bartext = term.red(BLOCK) + term.blue(BLOCK*3) + term.yellow(BLOCK*35) + ' ' * 41
         self.assertEqual(formatted, bartext)
 
+    def test_subcounter_color_changed(self):
+        """
+        Bar is redrawn when a subcounter color changes, even if block counts are the same
+        """
+
+        ctr = self.manager.counter(stream=self.tty.stdout, total=100, bar_format=u'{bar}')
+        term = ctr.manager.term
+        ctr.count = 50
+        subcounter = ctr.add_subcounter('yellow', count=50)
+
+        formatted = ctr.format(width=80)
+        self.assertEqual(formatted, term.yellow(BLOCK * 40) + ' ' * 40)
+
+        subcounter.color = 'blue'
+        formatted = ctr.format(width=80)
+        self.assertEqual(formatted, term.blue(BLOCK * 40) + ' ' * 40)
+
     def test_subcounter_rounding(self):
         """
         Extend subcounters to account for remainders when count reaches total
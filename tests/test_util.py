@@ -13,7 +13,8 @@ from textwrap import dedent
 
 import blessed
 
-from enlighten._util import format_time, Lookahead, HTMLConverter
+from enlighten._util import (compile_format, format_field_names, format_time, Lookahead,
+                             HTMLConverter)
 
 from tests import TestCase, MockTTY
 
@@ -54,6 +55,61 @@ class TestFormatTime(TestCase):
         self.assertEqual(format_time(1447597), '16d 18h 06:37')
 
 
+class TestCompileFormat(TestCase):
+    """
+    Test cases for :py:func:`compile_format`
+    """
+
+    fields = {'count': 5, 'len_total': 3, 'desc': u'Test', 'rate': 1.23456, 'items': [1, 2]}
+
+    def test_compiled(self):
+        """Compiled formats match str.format"""
+
+        for fmt in (u'', u'Plain text', u'{desc}', u'{desc}: {count:{len_total}d} {rate:.2f}',
+                    u'{{{desc}}}', u'{desc!r} {count!s:>4}',
+                    u'{count:0{len_total}d}{desc:^{count}}'):
+            self.assertEqual(compile_format(fmt)(self.fields), fmt.format(**self.fields))
+
+    def test_fallback(self):
+        """Formats that can't be compiled still match str.format"""
+
+        for fmt in (u'{items[0]}', u'{desc.upper}', u'{desc!a}', u'{count:{items[1]}}'):
+            self.assertEqual(compile_format(fmt)(self.fields), fmt.format(**self.fields))
+
+        with self.assertRaisesRegex(ValueError, 'Single'):
+            compile_format(u'{desc}}')(self.fields)
+
+    def test_missing_field(self):
+        """Missing fields raise KeyError"""
+
+        with self.assertRaisesRegex(KeyError, 'unit'):
+            compile_format(u'{count} {unit}')(self.fields)
+
+        with self.assertRaisesRegex(KeyError, 'width'):
+            compile_format(u'{count:{width}d}')(self.fields)
+
+
+class TestFormatFieldNames(TestCase):
+    """
+    Test cases for :py:func:`format_field_names`
+    """
+
+    def test_field_names(self):
+        """Base names of fields are returned, including nested fields"""
+
+        self.assertEqual(format_field_names(u'Plain text'), frozenset())
+        self.assertEqual(format_field_names(u'{desc}: {count:{len_total}d} {{rate}}'),
+                         frozenset(('desc', 'count', 'len_total')))
+        self.assertEqual(format_field_names(u'{items[0]} {desc.upper} {count:{items[1]}}'),
+                         frozenset(('items', 'desc', 'count')))
+
+    def test_invalid(self):
+        """None is returned when the format can't be parsed"""
+
+        self.assertIsNone(format_field_names(u'{desc}}'))
+        self.assertIsNone(format_field_names(u'{count:{len_total}'))
+
+
 class TestLookahead(TestCase):
     """
     Test cases for Lookahead